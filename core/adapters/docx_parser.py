@@ -25,8 +25,7 @@ from core.model.internal_doc import (
     Inline,
 )
 from core.model.resource_ref import ResourceRef
-
-NS = {'w': 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'}
+from core.adapters.wordml import NS, W_T, W_STYLE, W_VAL, W_STYLE_ID
 
 DEFAULT_HEADING_PATTERNS = [
     r"^Heading\s*(\d)$",           # English
@@ -38,18 +37,43 @@ DEFAULT_HEADING_PATTERNS = [
     r".*\bheading\s*(\d)$",        # fallback lowercase '... heading 2'
 ]
 
-def _read(z: zipfile.ZipFile, name: str) -> bytes | None:
+def compile_heading_patterns(patterns: List[str]) -> List[re.Pattern]:
+    """Compile heading style-name patterns (matched case-insensitively)."""
+    return [re.compile(p, re.IGNORECASE) for p in patterns]
+
+# The defaults fused into one alternation, tried in the same order; exactly
+# one alternative's group participates in a match
+_DEFAULT_HEADING_RE = re.compile(
+    "|".join(f"(?:{p})" for p in DEFAULT_HEADING_PATTERNS), re.IGNORECASE
+)
+_HEADING_STYLE_ID_RE = re.compile(r"^Heading(\d)$", re.IGNORECASE)
+
+# Numbering at the start of a paragraph: "4.1.3 " or "4.1.3. "
+_RUN_NUMBERING_RES = [
+    re.compile(r'^(\d+(?:\.\d+)*)\s+'),  # "4.1.3 "
+    re.compile(r'^(\d+(?:\.\d+)*)\.\s+'),  # "4.1.3. "
+]
+
+# Heading number followed by its title
+_HEADING_NUMBER_RES = [
+    re.compile(r'^(\d+(?:\.\d+)*)\s+(.+)$'),  # "4.1.3 Title" or "2.1 Title" or "2 Title"
+    re.compile(r'^(\d+(?:\.\d+)*)\.\s+(.+)$'),  # "4.1.3. Title"
+    re.compile(r'^(\d+(?:\.\d+)*)\s*[-–—]\s*(.+)$'),  # "4.1.3 - Title" or "4.1.3 – Title"
+]
+
+def read_docx_part(z: zipfile.ZipFile, name: str) -> bytes | None:
+    """Read a part from the DOCX archive, or None if it is missing."""
     return z.read(name) if name in z.namelist() else None
 
-def _styles_map(styles_xml: bytes | None) -> Dict[str, str]:
+def build_styles_map(styles_xml: bytes | None) -> Dict[str, str]:
     """Map styleId -> human-readable name from styles.xml."""
     if not styles_xml: return {}
     root = ET.fromstring(styles_xml)
     out: Dict[str, str] = {}
-    for s in root.findall(".//w:style", NS):
-        sid = s.attrib.get(f"{{{NS['w']}}}styleId")
+    for s in root.iter(W_STYLE):
+        sid = s.attrib.get(W_STYLE_ID)
         name_el = s.find("w:name", NS)
-        name = name_el.attrib.get(f"{{{NS['w']}}}val") if name_el is not None else sid
+        name = name_el.attrib.get(W_VAL) if name_el is not None else sid
         if sid: out[sid] = name
     return out
 
@@ -70,8 +94,8 @@ def _get_paragraph_number(p: ET.Element, numbering_xml: bytes = None) -> str:
     if numId_el is None or ilvl_el is None:
         return ""
     
-    numId = numId_el.attrib.get(f"{{{NS['w']}}}val", "")
-    ilvl = ilvl_el.attrib.get(f"{{{NS['w']}}}val", "0")
+    numId = numId_el.attrib.get(W_VAL, "")
+    ilvl = ilvl_el.attrib.get(W_VAL, "0")
     
     # For now, we'll use a simplified approach since parsing numbering.xml
     # is complex. We'll look for common numbering patterns in the text itself
@@ -97,23 +121,18 @@ def _extract_numbering_from_runs(p: ET.Element) -> str:
     
     full_start = "".join(first_run_texts)
     
-    # Pattern to match numbering at start: "4.1.3 " or "4.1 " or "4 "
-    numbering_patterns = [
-        r'^(\d+(?:\.\d+)*)\s+',  # "4.1.3 " 
-        r'^(\d+(?:\.\d+)*)\.\s+',  # "4.1.3. "
-    ]
-    
-    for pattern in numbering_patterns:
-        match = re.match(pattern, full_start)
+    # Match numbering at start: "4.1.3 " or "4.1 " or "4 "
+    for pattern in _RUN_NUMBERING_RES:
+        match = pattern.match(full_start)
         if match:
             return match.group(1)
     
     return ""
 
-def _text_of(p: ET.Element) -> str:
+def paragraph_text(p: ET.Element) -> str:
     """Extract text from paragraph, including any manual numbering."""
     texts: List[str] = []
-    for t in p.findall(".//w:t", NS):
+    for t in p.iter(W_T):
         texts.append(t.text or "")
     full_text = "".join(texts).strip()
     
@@ -125,8 +144,8 @@ def _text_with_numbering(p: ET.Element) -> str:
     auto_number = _get_paragraph_number(p)
     if auto_number:
         # Remove the numbering from the text if it's duplicated
-        text = _text_of(p)
-        number, title = _extract_heading_number_and_title(text)
+        text = paragraph_text(p)
+        number, title = extract_heading_number_and_title(text)
         if number:  # If text already has numbering, use the text as-is
             return text
         else:  # Add the automatic numbering to clean text
@@ -134,7 +153,7 @@ def _text_with_numbering(p: ET.Element) -> str:
     
     # Fallback: try to extract numbering from text runs
     run_number = _extract_numbering_from_runs(p)
-    text = _text_of(p)
+    text = paragraph_text(p)
     
     if run_number:
         # Check if the number is already in the text
@@ -145,7 +164,7 @@ def _text_with_numbering(p: ET.Element) -> str:
     
     return text
 
-def _extract_heading_number_and_title(text: str) -> tuple[str, str]:
+def extract_heading_number_and_title(text: str) -> tuple[str, str]:
     """Extract chapter number and title from heading text.
     
     Args:
@@ -154,30 +173,29 @@ def _extract_heading_number_and_title(text: str) -> tuple[str, str]:
     Returns:
         tuple of (number, title) where number might be empty if no numbering found
     """
-    # Pattern to match various numbering formats
-    number_patterns = [
-        r'^(\d+(?:\.\d+)*)\s+(.+)$',  # "4.1.3 Title" or "2.1 Title" or "2 Title"
-        r'^(\d+(?:\.\d+)*)\.\s+(.+)$',  # "4.1.3. Title" 
-        r'^(\d+(?:\.\d+)*)\s*[-–—]\s*(.+)$',  # "4.1.3 - Title" or "4.1.3 – Title"
-    ]
-    
-    for pattern in number_patterns:
-        match = re.match(pattern, text.strip())
+    # Match various numbering formats
+    stripped = text.strip()
+    for pattern in _HEADING_NUMBER_RES:
+        match = pattern.match(stripped)
         if match:
             return match.group(1), match.group(2).strip()
     
     # No numbering found, return empty number and full text as title
     return "", text
 
-def _heading_level(p: ET.Element, styles_map: Dict[str,str], heading_patterns: List[str]) -> int | None:
-    """Return heading level (1..9) or None if not a heading."""
+def heading_level(p: ET.Element, styles_map: Dict[str,str], heading_patterns: List[re.Pattern] | None = None) -> int | None:
+    """Return heading level (1..9) or None if not a heading.
+
+    heading_patterns are pre-compiled (see compile_heading_patterns) and carry
+    the level in group 1; None uses DEFAULT_HEADING_PATTERNS.
+    """
     pPr = p.find("w:pPr", NS)
     if pPr is None:
         return None
     # Prefer outlineLvl when present
     outline = pPr.find("w:outlineLvl", NS)
     if outline is not None:
-        val = outline.attrib.get(f"{{{NS['w']}}}val")
+        val = outline.attrib.get(W_VAL)
         if val is not None:
             try:
                 return int(val) + 1  # outlineLvl 0 => H1
@@ -186,24 +204,32 @@ def _heading_level(p: ET.Element, styles_map: Dict[str,str], heading_patterns: L
     # Fallback: paragraph style name
     pStyle = pPr.find("w:pStyle", NS)
     if pStyle is not None:
-        sid = pStyle.attrib.get(f"{{{NS['w']}}}val", "")
+        sid = pStyle.attrib.get(W_VAL, "")
         sname = styles_map.get(sid, sid) or sid
-        for pat in heading_patterns:
-            m = re.match(pat, sname, flags=re.IGNORECASE)
+        if heading_patterns is None:
+            m = _DEFAULT_HEADING_RE.match(sname)
             if m:
-                try:
-                    return int(m.group(1))
-                except ValueError:
-                    continue
+                return int(next(g for g in m.groups() if g is not None))
+        else:
+            for pat in heading_patterns:
+                m = pat.match(sname)
+                if m:
+                    try:
+                        return int(m.group(1))
+                    except ValueError:
+                        continue
         # Also try styleId like Heading1
-        m = re.match(r"^Heading(\d)$", sid, flags=re.IGNORECASE)
+        m = _HEADING_STYLE_ID_RE.match(sid)
         if m:
             return int(m.group(1))
     return None
 
+_SLUG_STRIP_RE = re.compile(r"[^\w\s-]", flags=re.UNICODE)
+_SLUG_SPACE_RE = re.compile(r"\s+")
+
 def _slug(text: str, maxlen: int = 80) -> str:
-    s = re.sub(r"[^\w\s-]", "", text, flags=re.UNICODE)
-    s = re.sub(r"\s+", "-", s).strip("-_").lower()
+    s = _SLUG_STRIP_RE.sub("", text)
+    s = _SLUG_SPACE_RE.sub("-", s).strip("-_").lower()
     return (s or "section")[:maxlen].rstrip("-_")
 
 def split_docx_by_h1(
@@ -222,29 +248,29 @@ def split_docx_by_h1(
     out_root.mkdir(parents=True, exist_ok=True)
 
     with zipfile.ZipFile(docx_path) as z:
-        doc_xml = _read(z, "word/document.xml")
-        styles_xml = _read(z, "word/styles.xml")
+        doc_xml = read_docx_part(z, "word/document.xml")
+        styles_xml = read_docx_part(z, "word/styles.xml")
     if not doc_xml:
         raise RuntimeError("word/document.xml not found")
 
-    styles_map = _styles_map(styles_xml)
+    styles_map = build_styles_map(styles_xml)
     body = ET.fromstring(doc_xml).find(".//w:body", NS)
     if body is None:
         raise RuntimeError("No <w:body> found")
 
-    patterns = heading_patterns or DEFAULT_HEADING_PATTERNS
+    patterns = compile_heading_patterns(heading_patterns) if heading_patterns else None
 
     sections: List[dict] = []
     current = {"title": "front-matter", "lines": []}  # content before first H1
 
     for p in body.findall("w:p", NS):
-        lvl = _heading_level(p, styles_map, patterns)
+        lvl = heading_level(p, styles_map, patterns)
         if lvl:
             # For headings, use numbering-aware text extraction
             t = _text_with_numbering(p)
         else:
             # For regular paragraphs, use simple text extraction
-            t = _text_of(p)
+            t = paragraph_text(p)
             
         if lvl == 1 and t:
             # Start new chapter
@@ -281,33 +307,38 @@ def parse_docx_to_internal_doc(docx_path: str) -> Tuple[InternalDoc, List[Resour
     Returns:
         Tuple of (InternalDoc, List[ResourceRef])
     """
-    from core.numbering.heading_numbering import extract_headings_with_numbers
+    from core.numbering.heading_numbering import extract_headings_from_parts
     
     docx_path = Path(docx_path)
     
-    # Extract numbered headings using comprehensive XML parsing
-    numbered_headings = extract_headings_with_numbers(str(docx_path))
-    
     with zipfile.ZipFile(docx_path) as z:
-        doc_xml = _read(z, "word/document.xml")
-        styles_xml = _read(z, "word/styles.xml")
+        doc_xml = read_docx_part(z, "word/document.xml")
+        styles_xml = read_docx_part(z, "word/styles.xml")
+        numbering_xml = read_docx_part(z, "word/numbering.xml")
     
     if not doc_xml:
         raise RuntimeError("word/document.xml not found")
     
-    styles_map = _styles_map(styles_xml)
-    body = ET.fromstring(doc_xml).find(".//w:body", NS)
+    # Parse document.xml once and share the tree with the numbering extraction
+    doc_root = ET.fromstring(doc_xml)
+    
+    # Extract numbered headings using comprehensive XML parsing
+    numbered_headings = extract_headings_from_parts(
+        doc_root, numbering_xml or b"<numbering/>", styles_xml or b"<styles/>"
+    )
+    
+    styles_map = build_styles_map(styles_xml)
+    body = doc_root.find(".//w:body", NS)
     if body is None:
         raise RuntimeError("No <w:body> found")
     
-    patterns = DEFAULT_HEADING_PATTERNS
     blocks: List[Block] = []
     resources: List[ResourceRef] = []  # DOCX images would need separate extraction
     heading_iter = iter(numbered_headings)
     
     for p in body.findall("w:p", NS):
-        lvl = _heading_level(p, styles_map, patterns)
-        text = _text_of(p)  # Get basic text first
+        lvl = heading_level(p, styles_map)
+        text = paragraph_text(p)  # Get basic text first
         
         if text:  # Only process non-empty paragraphs
             if lvl:
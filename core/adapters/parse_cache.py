@@ -0,0 +1,95 @@
+"""
+On-disk cache for parsed documents.
+
+Parsing is keyed by the SHA256 of the input file so that re-running the
+pipeline on an unchanged document skips the parse step entirely. Entries are
+also keyed by a fingerprint of the parser and model sources, so any change to
+the code that produces or defines the cached objects invalidates them.
+"""
+import hashlib
+import os
+import pickle
+import tempfile
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from core.model import internal_doc, resource_ref
+from core.model.internal_doc import InternalDoc
+from core.model.resource_ref import ResourceRef
+from core.numbering import heading_numbering
+from . import document_parser, docx_parser, wordml
+
+# Modules whose source determines the cached parse result and its pickled form
+_FINGERPRINT_MODULES = (
+    document_parser,
+    docx_parser,
+    wordml,
+    heading_numbering,
+    internal_doc,
+    resource_ref,
+)
+
+_READ_CHUNK_SIZE = 1 << 20
+
+
+def file_sha256(file_path: str) -> str:
+    """Computes the SHA256 of a file without loading it into memory at once."""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(_READ_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+@lru_cache(maxsize=1)
+def cache_version() -> str:
+    """Returns a short fingerprint of the parser, model and cache module sources."""
+    digest = hashlib.sha256()
+    for path in sorted(m.__file__ for m in _FINGERPRINT_MODULES) + [__file__]:
+        with open(path, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()[:16]
+
+
+def parse_document_cached(
+    file_path: str, cache_dir: Optional[str] = None
+) -> Tuple[InternalDoc, List[ResourceRef]]:
+    """
+    Parses a document, reusing a previously cached result when available.
+
+    Args:
+        file_path: Path to the input document.
+        cache_dir: Directory holding cached parse results. Caching is disabled when None.
+
+    Returns:
+        Tuple of (InternalDoc, List[ResourceRef]), as returned by parse_document.
+    """
+    if not cache_dir:
+        return document_parser.parse_document(file_path)
+
+    cache_path = Path(cache_dir) / f"{file_sha256(file_path)}-{cache_version()}.pkl"
+    if cache_path.exists():
+        try:
+            with open(cache_path, "rb") as f:
+                return pickle.load(f)
+        except Exception:
+            # Corrupt, unreadable or incompatible entry (e.g. pickled against a
+            # model class that no longer exists) - fall through and re-parse
+            pass
+
+    result = document_parser.parse_document(file_path)
+
+    # Write atomically so concurrent runs never observe a partial entry
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+    return result
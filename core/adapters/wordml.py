@@ -0,0 +1,24 @@
+"""
+WordprocessingML names shared by the DOCX XML parsers.
+
+Tag and attribute names are pre-expanded to Clark notation ("{namespace}name"),
+so hot loops can use Element.get()/iter() without prefix expansion.
+"""
+
+NS = {'w': 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'}
+
+W = f"{{{NS['w']}}}"
+
+# Elements
+W_BODY = W + "body"
+W_P = W + "p"
+W_T = W + "t"
+W_STYLE = W + "style"
+
+# Attributes
+W_VAL = W + "val"
+W_STYLE_ID = W + "styleId"
+W_TYPE = W + "type"
+W_ABSTRACT_NUM_ID = W + "abstractNumId"
+W_ILVL = W + "ilvl"
+W_NUM_ID = W + "numId"
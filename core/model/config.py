@@ -2,7 +2,7 @@
 
 import yaml
 from pathlib import Path
-from typing import Optional
+from typing import Literal, Optional
 from pydantic import BaseModel, Field
 
 
@@ -19,6 +19,14 @@ class PipelineConfig(BaseModel):
     # Content configuration
     frontmatter_enabled: bool = Field(default=True, description="Whether to include frontmatter in output")
     locale: str = Field(default="en", description="Language/locale for processing")
+
+    # Execution configuration
+    parallel_backend: Literal["serial", "thread", "process"] = Field(
+        default="serial", description="How chapters are rendered and written: serial, thread or process pool"
+    )
+
+    # Caching configuration
+    cache_dir: Optional[str] = Field(default=None, description="Directory for cached parse results (disabled when unset)")
     
     @classmethod
     def from_yaml(cls, config_path: Path) -> "PipelineConfig":
@@ -3,9 +3,13 @@ Automatic hierarchical numbering for document headings.
 Generates numbering like: 1, 1.1, 1.1.1, 1.2, 2, 2.1, etc.
 """
 
+import re
 from typing import List, Dict
 from core.model.internal_doc import InternalDoc, Block, Heading
 
+# Existing leading numbering followed by the title, e.g. "1.2 Title"
+_EXISTING_NUMBER_RE = re.compile(r'^[\d\.\s]+(.+)$')
+
 class AutoNumberer:
     """Generates automatic hierarchical numbering for headings."""
     
@@ -68,8 +72,7 @@ def add_automatic_numbering(doc: InternalDoc) -> InternalDoc:
             else:
                 # Heading might already have numbering, replace it
                 # Find where the title starts (after potential existing numbering)
-                import re
-                match = re.match(r'^[\d\.\s]+(.+)$', text)
+                match = _EXISTING_NUMBER_RE.match(text)
                 if match:
                     title = match.group(1).strip()
                     numbered_text = f"{number} {title}"
@@ -111,8 +114,7 @@ def add_numbering_to_chapters(chapters: List[InternalDoc]) -> List[InternalDoc]:
                     numbered_text = f"{number} {text}"
                 else:
                     # Replace existing numbering
-                    import re
-                    match = re.match(r'^[\d\.\s]+(.+)$', text)
+                    match = _EXISTING_NUMBER_RE.match(text)
                     if match:
                         title = match.group(1).strip()
                         numbered_text = f"{number} {title}"
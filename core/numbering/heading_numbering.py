@@ -4,7 +4,16 @@ from xml.etree import ElementTree as ET
 from dataclasses import dataclass
 from typing import Dict, List, Optional, Tuple
 
-NS = {"w": "http://schemas.openxmlformats.org/wordprocessingml/2006/main"}
+from core.adapters.wordml import (
+    NS,
+    W_T,
+    W_VAL,
+    W_STYLE_ID,
+    W_TYPE,
+    W_ABSTRACT_NUM_ID,
+    W_ILVL,
+    W_NUM_ID,
+)
 
 @dataclass
 class NumberedHeading:
@@ -46,29 +55,36 @@ def _fmt(fmt: str, n: int) -> str:
     if fmt == "lowerletter": return chr(ord('a') + ((n-1) % 26))
     return str(n)
 
+_TRAILING_NUMBER_RE = re.compile(r'(\d+)$')
+_HEADING_STYLE_ID_RE = re.compile(r'(?i)Heading\d+|Заголовок\s*\d+')
+
+_SLUG_STRIP_RE = re.compile(r'[^a-z0-9\u0400-\u04FF\s-]+')
+_SLUG_SPACE_RE = re.compile(r'\s+')
+_SLUG_DASHES_RE = re.compile(r'-+')
+
 def _slug(s:str)->str:
     s = s.strip().lower()
-    s = re.sub(r'[^a-z0-9\u0400-\u04FF\s-]+', '', s)
-    s = re.sub(r'\s+', '-', s)
-    return re.sub(r'-+', '-', s).strip('-')
+    s = _SLUG_STRIP_RE.sub('', s)
+    s = _SLUG_SPACE_RE.sub('-', s)
+    return _SLUG_DASHES_RE.sub('-', s).strip('-')
 
 def _parse_numbering(xml: bytes) -> Dict[int, NumDef]:
     root = ET.fromstring(xml); nums: Dict[int, NumDef] = {}; abstract: Dict[int, Dict[int, Lvl]] = {}
     for an in root.findall("w:abstractNum", NS):
-        an_id = int(an.get(f"{{{NS['w']}}}abstractNumId")); lvls={}
+        an_id = int(an.get(W_ABSTRACT_NUM_ID)); lvls={}
         for lvl in an.findall("w:lvl", NS):
-            ilvl = int(lvl.get(f"{{{NS['w']}}}ilvl"))
-            start = lvl.find("w:start", NS); start_val = int(start.get(f"{{{NS['w']}}}val")) if start is not None else 1
-            numFmt_el = lvl.find("w:numFmt", NS); fmt = numFmt_el.get(f"{{{NS['w']}}}val") if numFmt_el is not None else "decimal"
-            lvlText_el = lvl.find("w:lvlText", NS); lvlText = lvlText_el.get(f"{{{NS['w']}}}val") if lvlText_el is not None else "%1."
-            restart_el = lvl.find("w:lvlRestart", NS); restart = int(restart_el.get(f"{{{NS['w']}}}val")) if restart_el is not None else None
+            ilvl = int(lvl.get(W_ILVL))
+            start = lvl.find("w:start", NS); start_val = int(start.get(W_VAL)) if start is not None else 1
+            numFmt_el = lvl.find("w:numFmt", NS); fmt = numFmt_el.get(W_VAL) if numFmt_el is not None else "decimal"
+            lvlText_el = lvl.find("w:lvlText", NS); lvlText = lvlText_el.get(W_VAL) if lvlText_el is not None else "%1."
+            restart_el = lvl.find("w:lvlRestart", NS); restart = int(restart_el.get(W_VAL)) if restart_el is not None else None
             lvls[ilvl] = Lvl(ilvl, start_val, fmt, lvlText, restart)
         abstract[an_id] = lvls
     for n in root.findall("w:num", NS):
-        numId = int(n.get(f"{{{NS['w']}}}numId"))
+        numId = int(n.get(W_NUM_ID))
         an_ref = n.find("w:abstractNumId", NS)
         if an_ref is None: continue
-        an_id = int(an_ref.get(f"{{{NS['w']}}}val"))
+        an_id = int(an_ref.get(W_VAL))
         nums[numId] = NumDef(numId, an_id, abstract.get(an_id, {}))
     return nums
 
@@ -77,15 +93,15 @@ def _style_to_level(styles_xml: Optional[bytes]) -> Dict[str, int]:
     res: Dict[str,int] = {}
     root = ET.fromstring(styles_xml)
     for s in root.findall("w:style", NS):
-        if s.get(f"{{{NS['w']}}}type") != "paragraph": continue
-        sid = s.get(f"{{{NS['w']}}}styleId")
-        name_el = s.find("w:name", NS); name = (name_el.get(f"{{{NS['w']}}}val") if name_el is not None else "").lower()
+        if s.get(W_TYPE) != "paragraph": continue
+        sid = s.get(W_STYLE_ID)
+        name_el = s.find("w:name", NS); name = (name_el.get(W_VAL) if name_el is not None else "").lower()
         if sid and (name.startswith("heading") or "заголовок" in name):
-            m = re.search(r'(\d+)$', sid) or re.search(r'(\d+)$', name)
+            m = _TRAILING_NUMBER_RE.search(sid) or _TRAILING_NUMBER_RE.search(name)
             if m: res[sid] = int(m.group(1)) - 1
         ppr = s.find("w:pPr", NS); ol = ppr.find("w:outlineLvl", NS) if ppr is not None else None
         if ol is not None and sid:
-            lvl = int(ol.get(f"{{{NS['w']}}}val")); res[sid] = min(res.get(sid, lvl), lvl) if sid in res else lvl
+            lvl = int(ol.get(W_VAL)); res[sid] = min(res.get(sid, lvl), lvl) if sid in res else lvl
     return res
 
 def extract_headings_with_numbers(docx_path: str) -> List[NumberedHeading]:
@@ -100,9 +116,13 @@ def extract_headings_with_numbers(docx_path: str) -> List[NumberedHeading]:
         except KeyError:
             styles = b"<styles/>"  # Empty styles if file doesn't exist
     
+    return extract_headings_from_parts(ET.fromstring(doc), numbering, styles)
+
+def extract_headings_from_parts(doc_root: ET.Element, numbering: bytes, styles: bytes) -> List[NumberedHeading]:
+    """Same as extract_headings_with_numbers, for a document.xml tree the caller has already parsed."""
     nums = _parse_numbering(numbering)
     style2lvl = _style_to_level(styles)
-    root = ET.fromstring(doc); body = root.find("w:body", NS)
+    body = doc_root.find("w:body", NS)
     counters_by_numId: Dict[int, List[int]] = {}
     results: List[NumberedHeading] = []
 
@@ -110,16 +130,16 @@ def extract_headings_with_numbers(docx_path: str) -> List[NumberedHeading]:
         ppr = p.find("w:pPr", NS)
         if ppr is None: continue
         style_el = ppr.find("w:pStyle", NS)
-        style_id = style_el.get(f"{{{NS['w']}}}val") if style_el is not None else None
+        style_id = style_el.get(W_VAL) if style_el is not None else None
 
         level = None
         if style_id and style_id in style2lvl: level = style2lvl[style_id]
         if level is None:
             ol = ppr.find("w:outlineLvl", NS)
-            if ol is not None: level = int(ol.get(f"{{{NS['w']}}}val"))
-        if level is None and style_id and re.match(r'(?i)Heading\d+|Заголовок\s*\d+', style_id):
-            m = re.search(r'(\d+)$', style_id);  level = int(m.group(1)) - 1 if m else None
-        text = ''.join(t.text or '' for t in p.findall(".//w:t", NS)).strip()
+            if ol is not None: level = int(ol.get(W_VAL))
+        if level is None and style_id and _HEADING_STYLE_ID_RE.match(style_id):
+            m = _TRAILING_NUMBER_RE.search(style_id);  level = int(m.group(1)) - 1 if m else None
+        text = ''.join(t.text or '' for t in p.iter(W_T)).strip()
         if level is None or not text: continue
 
         number_text = ""; numId = None; ilvl = None
@@ -127,7 +147,7 @@ def extract_headings_with_numbers(docx_path: str) -> List[NumberedHeading]:
         if numPr is not None:
             ilvl_el = numPr.find("w:ilvl", NS); numId_el = numPr.find("w:numId", NS)
             if ilvl_el is not None and numId_el is not None:
-                ilvl = int(ilvl_el.get(f"{{{NS['w']}}}val")); numId = int(numId_el.get(f"{{{NS['w']}}}val"))
+                ilvl = int(ilvl_el.get(W_VAL)); numId = int(numId_el.get(W_VAL))
                 ndef = nums.get(numId)
                 if ndef:
                     if numId not in counters_by_numId:
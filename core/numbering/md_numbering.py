@@ -4,6 +4,7 @@ from typing import Iterable
 from core.numbering.heading_numbering import NumberedHeading
 
 HEADING_RE = re.compile(r'^(#{1,6})\s+(.*\S)\s*$')
+_LEADING_NUMBER_RE = re.compile(r'^(?:\d+(?:[.\-]\d+)*|[IVXLCDM]+)\s+', re.IGNORECASE)
 
 def apply_numbers_to_markdown(md_text: str, numbered: Iterable[NumberedHeading]) -> str:
     """
@@ -21,7 +22,7 @@ def apply_numbers_to_markdown(md_text: str, numbered: Iterable[NumberedHeading])
 
         # Strip any existing leading number (e.g., '1.2.3 ' / 'IV ' / 'A.1 ')
         # Use word boundary to ensure we match complete number tokens
-        title_clean = re.sub(r'^(?:\d+(?:[.\-]\d+)*|[IVXLCDM]+)\s+', '', title, flags=re.IGNORECASE)
+        title_clean = _LEADING_NUMBER_RE.sub('', title)
 
         try:
             h = next(it)
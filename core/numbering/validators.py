@@ -5,6 +5,9 @@ import re
 from typing import List
 from core.numbering.heading_numbering import NumberedHeading
 
+_MD_HEADING_RE = re.compile(r'^(#{1,6})\s+(.+)$')
+_NUMBERED_TITLE_RE = re.compile(r'^[\dIVXLCDM]+(?:[.\-]\d+)*\s+', re.IGNORECASE)
+
 
 class NumberingValidationError(Exception):
     """Raised when heading numbering validation fails."""
@@ -79,12 +82,11 @@ def _validate_no_double_numbering(headings: List[NumberedHeading]) -> None:
         text_after_number = heading.text.strip()
         
         # Remove the expected number from the beginning
-        expected_pattern = re.escape(heading.number) + r'\s+'
-        if re.match(expected_pattern, text_after_number):
-            remaining = re.sub(expected_pattern, '', text_after_number, count=1)
-            
+        expected_pattern = re.compile(re.escape(heading.number) + r'\s+')
+        match = expected_pattern.match(text_after_number)
+        if match:
             # Check if the remaining text starts with the same number
-            if re.match(expected_pattern, remaining):
+            if expected_pattern.match(text_after_number, match.end()):
                 raise NumberingValidationError(
                     f"Double numbering detected in heading: '{heading.text}'"
                 )
@@ -99,19 +101,22 @@ def validate_markdown_numbering(md_text: str) -> None:
     Raises:
         NumberingValidationError: If any heading lacks numbering
     """
-    lines = md_text.splitlines()
-    heading_pattern = re.compile(r'^(#{1,6})\s+(.+)$')
+    # Fast exit: without any '#' there can be no heading lines
+    if '#' not in md_text:
+        return
     
-    for line_num, line in enumerate(lines, 1):
-        match = heading_pattern.match(line)
+    for line_num, line in enumerate(md_text.splitlines(), 1):
+        # Cheap prefilter: only heading lines need the regex
+        if not line.startswith('#'):
+            continue
+        match = _MD_HEADING_RE.match(line)
         if not match:
             continue
         
-        level = len(match.group(1))
         title = match.group(2).strip()
         
         # Check if title starts with a number
-        if not re.match(r'^[\dIVXLCDM]+(?:[.\-]\d+)*\s+', title, re.IGNORECASE):
+        if not _NUMBERED_TITLE_RE.match(title):
             raise NumberingValidationError(
                 f"Line {line_num}: Heading missing numbering: '{line}'"
             )
\ No newline at end of file
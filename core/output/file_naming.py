@@ -1,6 +1,12 @@
 import re
 from slugify import slugify
 
+_MD_HASHES_RE = re.compile(r'^#+\s*')
+_NUMBER_TOKEN_RE = re.compile(r'^([^\s]+)\s+.*$')
+_NUMBER_SEP_RE = re.compile(r'[.\-]')
+_LEADING_NUMBER_RE = re.compile(r'^[\dIVXLCDM]+(?:[.\-]\d+)*\s+', re.IGNORECASE)
+
+
 def chapter_index_from_h1(heading_line: str) -> int:
     """Extract chapter index from H1 heading line.
     
@@ -11,14 +17,14 @@ def chapter_index_from_h1(heading_line: str) -> int:
         Integer index from the first component of the number, defaulting to 1
     """
     # Remove markdown hashes if present
-    text = re.sub(r'^#+\s*', '', heading_line.strip())
+    text = _MD_HASHES_RE.sub('', heading_line.strip())
     
     # Extract number at the beginning: "3.1" or "3" or "III" etc.
-    m = re.match(r'^([^\s]+)\s+.*$', text.strip())
+    m = _NUMBER_TOKEN_RE.match(text.strip())
     if not m:
         return 1
     num = m.group(1)  # e.g., "3" or "3.1"
-    first = re.split(r'[.\-]', num)[0]
+    first = _NUMBER_SEP_RE.split(num)[0]
     try:
         return int(first)
     except ValueError:
@@ -51,7 +57,7 @@ def generate_chapter_filename(index: int, title: str, pattern: str = "{index:02d
         chapter_index = extracted_index if extracted_index > 1 else index
     
     # Clean title for slug (remove the number part if present)
-    clean_title = re.sub(r'^[\dIVXLCDM]+(?:[.\-]\d+)*\s+', '', first_line_title, flags=re.IGNORECASE)
+    clean_title = _LEADING_NUMBER_RE.sub('', first_line_title)
     
     # Slugify the clean title
     slug = slugify(clean_title, max_length=60, word_boundary=True)
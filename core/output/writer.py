@@ -12,10 +12,12 @@ class Writer:
 
     def write_text(self, file_path: Path, content: str) -> None:
         """
-        Writes text content to a file.
+        Writes text content to a file as UTF-8.
+
+        The content is encoded once and written in binary mode, skipping the
+        text-layer buffering and newline translation.
         """
-        with open(file_path, "w", encoding="utf-8") as f:
-            f.write(content)
+        self.write_binary(file_path, content.encode("utf-8"))
 
     def write_binary(self, file_path: Path, content: bytes) -> None:
         """
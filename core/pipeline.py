@@ -1,8 +1,18 @@
 import json
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import List, NamedTuple
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
 
-from core.adapters.document_parser import parse_document
+try:
+    import orjson
+except ImportError:  # optional speedup; fall back to the stdlib encoder
+    orjson = None
+
+from core.adapters.parse_cache import parse_document_cached
+from core.model.internal_doc import Heading
 from core.model.metadata import Metadata
 from core.model.config import PipelineConfig
 from core.output.writer import Writer
@@ -10,7 +20,7 @@ from core.output.file_naming import generate_chapter_filename
 from core.output.toc_builder import build_index, build_manifest
 from core.render.assets_exporter import export_assets
 from core.render.markdown_renderer import render_markdown
-from core.split.chapter_splitter import split_into_chapters, ChapterRules
+from core.split.chapter_splitter import split_into_chapters, ChapterRules, HEADING_NUMBER_RE
 from core.transforms.normalize import run as normalize
 from core.transforms.structure_fixes import run as fix_structure
 from core.transforms.content_reorder import run as reorder_content
@@ -50,12 +60,11 @@ class DocumentPipeline:
             chapters_dir = doc_output_dir / "chapters"
             assets_dir = doc_output_dir / self.config.assets_dir
             
-            # Ensure directories exist
-            self.writer.ensure_dir(doc_output_dir)
+            # Ensure directories exist (creating chapters_dir also creates doc_output_dir)
             self.writer.ensure_dir(chapters_dir)
             
-            # 1. Parse with docling adapter
-            doc, resources = parse_document(input_path)
+            # 1. Parse with docling adapter (reusing a cached result when enabled)
+            doc, resources = parse_document_cached(input_path, self.config.cache_dir)
 
             # 2. Apply transforms
             doc = normalize(doc)
@@ -70,38 +79,15 @@ class DocumentPipeline:
             asset_map = export_assets(resources, str(assets_dir))
 
             # 5. Render markdown for each chapter and write files
-            chapter_files = []
-            chapter_info = []
-            
-            for i, chapter in enumerate(chapters):
-                # Generate chapter title
-                if i == 0:
-                    # For chapter 0, combine special sections into a meaningful title
-                    chapter_title = _get_zero_chapter_title(chapter)
-                else:
-                    # For main chapters, find first heading and renumber it
-                    chapter_title = _get_main_chapter_title(chapter, i)
-                
-                # Fallback
-                if not chapter_title:
-                    chapter_title = f"Chapter {i}"
-                
-                # Generate filename - start numbering from 0 for title page/TOC
-                filename = generate_chapter_filename(i, chapter_title, self.config.chapter_pattern)
-                chapter_path = chapters_dir / filename
-                
-                # Render markdown
-                markdown_content = render_markdown(chapter, asset_map)
-                
-                # Write chapter file
-                self.writer.write_text(chapter_path, markdown_content)
-                chapter_files.append(str(chapter_path))
-                
-                # Store chapter info for TOC
-                chapter_info.append({
-                    "title": chapter_title,
-                    "path": f"chapters/{filename}"
-                })
+            chapter_tasks = [
+                (i, chapter, self.config.chapter_pattern, chapters_dir, asset_map, self.writer)
+                for i, chapter in enumerate(chapters)
+            ]
+            chapter_results = _map_chapters(
+                _render_and_write_chapter, chapter_tasks, self.config.parallel_backend
+            )
+            chapter_files = [chapter_file for chapter_file, _ in chapter_results]
+            chapter_info = [info for _, info in chapter_results]
 
             # 6. Generate metadata
             metadata = Metadata(
@@ -117,15 +103,15 @@ class DocumentPipeline:
             # 8. Generate and write manifest.json
             manifest_data = build_manifest(chapter_info, asset_map, metadata)
             manifest_path = doc_output_dir / "manifest.json"
-            manifest_json = json.dumps(manifest_data, indent=2, ensure_ascii=False)
-            self.writer.write_text(manifest_path, manifest_json)
+            self.writer.write_binary(manifest_path, _dump_manifest(manifest_data))
 
-            # Get list of asset files - asset_map values are relative paths that include the directory name
-            asset_files = []
-            for relative_path in asset_map.values():
-                # Extract just the filename from the relative path (remove the directory part)
-                filename = Path(relative_path).name
-                asset_files.append(str(assets_dir / filename))
+            # Get list of asset files - asset_map values are relative paths that include the directory name,
+            # so keep just the filename and re-root it under assets_dir
+            assets_dir_str = str(assets_dir)
+            asset_files = [
+                os.path.join(assets_dir_str, os.path.basename(relative_path))
+                for relative_path in asset_map.values()
+            ]
 
             return PipelineResult(
                 success=True,
@@ -145,6 +131,102 @@ class DocumentPipeline:
                 error_message=str(e)
             )
 
+    def process_many(
+        self, input_paths: List[str], output_dir: str, max_workers: Optional[int] = None
+    ) -> List[PipelineResult]:
+        """
+        Runs the pipeline over several documents, one worker process per document.
+
+        Args:
+            input_paths: Paths to the input documents (DOCX)
+            output_dir: Directory to write output files
+            max_workers: Maximum number of worker processes (defaults to the CPU count)
+
+        Returns:
+            List of PipelineResult, in the same order as input_paths
+
+        Raises:
+            ValueError: If two inputs share a file stem, since both would be
+                written to the same output_dir/<stem> directory
+        """
+        stem_counts = Counter(Path(input_path).stem for input_path in input_paths)
+        duplicates = sorted(stem for stem, count in stem_counts.items() if count > 1)
+        if duplicates:
+            raise ValueError(
+                f"Input files must have unique names; duplicate stems: {', '.join(duplicates)}"
+            )
+
+        workers = min(max_workers or os.cpu_count() or 1, len(input_paths))
+        if workers <= 1:
+            return [self.process(input_path, output_dir) for input_path in input_paths]
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(partial(self.process, output_dir=output_dir), input_paths))
+
+
+def _render_and_write_chapter(task: Tuple) -> Tuple[str, Dict[str, str]]:
+    """
+    Renders a single chapter and writes it to disk.
+
+    Kept at module level so it can be shipped to process-pool workers.
+
+    Args:
+        task: Tuple of (index, chapter, chapter_pattern, chapters_dir, asset_map, writer)
+
+    Returns:
+        Tuple of (written chapter path, chapter info for the TOC)
+    """
+    i, chapter, chapter_pattern, chapters_dir, asset_map, writer = task
+
+    # Generate chapter title
+    if i == 0:
+        # For chapter 0, combine special sections into a meaningful title
+        chapter_title = _get_zero_chapter_title(chapter)
+    else:
+        # For main chapters, find first heading and renumber it
+        chapter_title = _get_main_chapter_title(chapter, i)
+
+    # Fallback
+    if not chapter_title:
+        chapter_title = f"Chapter {i}"
+
+    # Generate filename - start numbering from 0 for title page/TOC
+    filename = generate_chapter_filename(i, chapter_title, chapter_pattern)
+    chapter_path = chapters_dir / filename
+
+    # Render markdown and write chapter file
+    writer.write_text(chapter_path, render_markdown(chapter, asset_map))
+
+    # Chapter info for TOC
+    return str(chapter_path), {"title": chapter_title, "path": f"chapters/{filename}"}
+
+
+def _map_chapters(func: Callable, tasks: List[Tuple], backend: str) -> List:
+    """
+    Applies func to every chapter task, preserving order.
+
+    Args:
+        func: Per-chapter worker function
+        tasks: Per-chapter argument tuples
+        backend: "serial", "thread" (overlaps disk writes) or "process" (CPU-bound rendering)
+
+    Returns:
+        List of results in task order
+    """
+    if backend == "serial" or len(tasks) < 2:
+        return [func(task) for task in tasks]
+
+    executor_cls = ProcessPoolExecutor if backend == "process" else ThreadPoolExecutor
+    with executor_cls(max_workers=min(len(tasks), os.cpu_count() or 1)) as executor:
+        return list(executor.map(func, tasks))
+
+
+def _dump_manifest(manifest_data: dict) -> bytes:
+    """Serializes the manifest to indented UTF-8 JSON, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(manifest_data, option=orjson.OPT_INDENT_2)
+    return json.dumps(manifest_data, indent=2, ensure_ascii=False).encode("utf-8")
+
 
 def _get_zero_chapter_title(chapter) -> str:
     """
@@ -164,8 +246,7 @@ def _get_zero_chapter_title(chapter) -> str:
             heading_text = block.text.strip().lower()
             
             # Clean heading text
-            import re
-            clean_heading = re.sub(r'^\d+(\.\d+)*\.?\s*', '', heading_text).strip()
+            clean_heading = HEADING_NUMBER_RE.sub('', heading_text).strip()
             
             if 'аннотация' in clean_heading:
                 found_sections.append('АННОТАЦИЯ')
@@ -190,15 +271,15 @@ def _get_main_chapter_title(chapter, chapter_num: int) -> str:
     Returns:
         Properly numbered chapter title
     """
-    for block in chapter.blocks:
-        if block.type == "heading" and hasattr(block, 'text') and block.text.strip():
-            heading_text = block.text.strip()
-            
-            # Remove old numbering
-            import re
-            clean_title = re.sub(r'^\d+(\.\d+)*\.?\s*', '', heading_text).strip()
-            
-            # Return with new numbering
-            return f"{chapter_num} {clean_title}"
-    
-    return ""
+    heading = next(
+        (b for b in chapter.blocks if isinstance(b, Heading) and b.text.strip()),
+        None,
+    )
+    if heading is None:
+        return ""
+
+    # Remove old numbering
+    clean_title = HEADING_NUMBER_RE.sub('', heading.text.strip()).strip()
+
+    # Return with new numbering
+    return f"{chapter_num} {clean_title}"
@@ -6,31 +6,43 @@ from core.model.internal_doc import (
     Inline,
 )
 
+# Dispatch tables keyed by node type, avoiding an if/elif chain per node
+_INLINE_RENDERERS = {
+    "text": lambda inline: inline.content,
+    "bold": lambda inline: f"**{inline.content}**",
+    "italic": lambda inline: f"*{inline.content}*",
+    "link": lambda inline: f"[{inline.content}]({inline.href})",
+}
+
+def _render_paragraph(block: Block, asset_map: Dict[str, str]) -> str:
+    """Renders a paragraph by concatenating its inline elements."""
+    return "".join([_render_inline(inline) for inline in block.inlines])
+
+def _render_image(block: Block, asset_map: Dict[str, str]) -> str:
+    """Renders an image, resolving its resource ID through the asset map."""
+    path = asset_map.get(block.resource_id, "about:blank")
+    return f"![{block.alt}]({path})"
+
+# Other block types (List, Table) would be registered here.
+_BLOCK_RENDERERS = {
+    "heading": lambda block, asset_map: f"{'#' * block.level} {block.text}",
+    "paragraph": _render_paragraph,
+    "image": _render_image,
+}
+
 def _render_inline(inline: Inline) -> str:
     """Renders a single inline element to its Markdown representation."""
-    type = inline.type
-    if type == "text":
-        return inline.content
-    if type == "bold":
-        return f"**{inline.content}**"
-    if type == "italic":
-        return f"*{inline.content}*"
-    if type == "link":
-        return f"[{inline.content}]({inline.href})"
-    raise ValueError(f"Unknown inline type: {type}")
+    renderer = _INLINE_RENDERERS.get(inline.type)
+    if renderer is None:
+        raise ValueError(f"Unknown inline type: {inline.type}")
+    return renderer(inline)
 
 def _render_block(block: Block, asset_map: Dict[str, str]) -> str:
     """Renders a single block element to its Markdown representation."""
-    type = block.type
-    if type == "heading":
-        return f"{'#' * block.level} {block.text}"
-    if type == "paragraph":
-        return "".join(_render_inline(inline) for inline in block.inlines)
-    if type == "image":
-        path = asset_map.get(block.resource_id, "about:blank")
-        return f"![{block.alt}]({path})"
-    # Other block types (List, Table) would be handled here.
-    raise ValueError(f"Unknown block type: {type}")
+    renderer = _BLOCK_RENDERERS.get(block.type)
+    if renderer is None:
+        raise ValueError(f"Unknown block type: {block.type}")
+    return renderer(block, asset_map)
 
 def render_markdown(doc: InternalDoc, asset_map: Dict[str, str]) -> str:
     """
@@ -44,8 +56,4 @@ def render_markdown(doc: InternalDoc, asset_map: Dict[str, str]) -> str:
     Returns:
         A string containing the rendered Markdown document.
     """
-    markdown_parts = []
-    for block in doc.blocks:
-        markdown_parts.append(_render_block(block, asset_map))
-
-    return "\n\n".join(markdown_parts)
+    return "\n\n".join([_render_block(block, asset_map) for block in doc.blocks])
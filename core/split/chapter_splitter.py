@@ -1,8 +1,12 @@
+import re
 from typing import List, Set
 from pydantic import BaseModel
 
 from core.model.internal_doc import InternalDoc, Heading, Block
 
+# Leading numbering patterns (1, 1.1, 0.0.0.0.0.0.0.0.1, etc.)
+HEADING_NUMBER_RE = re.compile(r'^\d+(\.\d+)*\.?\s*')
+
 class ChapterRules(BaseModel):
     """Defines the rules for splitting a document into chapters."""
     level: int = 1 # The heading level to split on.
@@ -23,60 +27,52 @@ def split_into_chapters(doc: InternalDoc, rules: ChapterRules) -> List[InternalD
     if not doc.blocks:
         return []
 
-    # First pass: collect zero-chapter blocks (title page, annotation, TOC, etc.)
+    # Chapters are built with model_construct: every block already belongs to a
+    # validated InternalDoc, so re-validating each chapter's block list is wasted work.
+
+    # Single pass: zero-chapter blocks (title page, annotation, TOC, etc.) are
+    # collected while main content is cut into chapters at each split heading.
     zero_chapter_blocks: List[Block] = []
-    main_content_blocks: List[Block] = []
+    main_chapters: List[InternalDoc] = []
+    current_chapter_blocks: List[Block] = []
     
     collecting_zero_chapter = True
+    split_level = rules.level
+    zero_chapter_sections = rules.zero_chapter_sections
     
     for block in doc.blocks:
-        is_split_heading = isinstance(block, Heading) and block.level == rules.level
+        is_split_heading = isinstance(block, Heading) and block.level == split_level
         
         if is_split_heading:
             heading_text = block.text.strip().lower()
             # Remove numbering and check if this should be in zero chapter
             clean_heading = _clean_heading_for_comparison(heading_text)
             
-            if clean_heading in rules.zero_chapter_sections:
+            if clean_heading in zero_chapter_sections:
                 # This heading belongs to zero chapter
                 zero_chapter_blocks.append(block)
                 collecting_zero_chapter = True
             else:
-                # This is the first "real" chapter - stop collecting for zero chapter
+                # A "real" chapter starts here - stop collecting for zero chapter
                 collecting_zero_chapter = False
-                main_content_blocks.append(block)
-        else:
-            if collecting_zero_chapter:
-                zero_chapter_blocks.append(block)
-            else:
-                main_content_blocks.append(block)
-    
-    # Now split main content into chapters
-    chapters: List[InternalDoc] = []
-    
-    # Add zero chapter if it has content
-    if zero_chapter_blocks:
-        chapters.append(InternalDoc(blocks=zero_chapter_blocks))
-    
-    # Split remaining content into chapters
-    current_chapter_blocks: List[Block] = []
-    
-    for block in main_content_blocks:
-        is_split_heading = isinstance(block, Heading) and block.level == rules.level
-        
-        if is_split_heading and current_chapter_blocks:
-            # Start of a new chapter, so we finalize the previous one
-            chapters.append(InternalDoc(blocks=current_chapter_blocks))
-            current_chapter_blocks = [block]  # Start the new chapter with the heading
+                if current_chapter_blocks:
+                    # Finalize the previous chapter
+                    main_chapters.append(InternalDoc.model_construct(blocks=current_chapter_blocks))
+                current_chapter_blocks = [block]  # Start the new chapter with the heading
+        elif collecting_zero_chapter:
+            zero_chapter_blocks.append(block)
         else:
             # Continue adding to the current chapter
             current_chapter_blocks.append(block)
     
     # Add the last remaining chapter
     if current_chapter_blocks:
-        chapters.append(InternalDoc(blocks=current_chapter_blocks))
+        main_chapters.append(InternalDoc.model_construct(blocks=current_chapter_blocks))
     
-    return chapters
+    # Zero chapter (if it has content) always comes first
+    if zero_chapter_blocks:
+        return [InternalDoc.model_construct(blocks=zero_chapter_blocks)] + main_chapters
+    return main_chapters
 
 
 def _clean_heading_for_comparison(heading_text: str) -> str:
@@ -89,7 +85,6 @@ def _clean_heading_for_comparison(heading_text: str) -> str:
     Returns:
         Cleaned text for comparison
     """
-    import re
     # Remove various numbering patterns (1, 1.1, 0.0.0.0.0.0.0.0.1, etc.)
-    cleaned = re.sub(r'^\d+(\.\d+)*\.?\s*', '', heading_text)
+    cleaned = HEADING_NUMBER_RE.sub('', heading_text)
     return cleaned.strip().lower()
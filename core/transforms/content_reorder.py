@@ -77,28 +77,28 @@ def _identify_content_moves(blocks: List[Block]) -> List[Dict]:
     # Find these content blocks and mark them for moving
     section_2_1_idx = section_boundaries.get("2.1 Основные компоненты")
     if section_2_1_idx is not None:
+        # The target section range is fixed, and paragraph texts are joined
+        # once up front instead of once per searched content string.
+        next_section_idx = _find_next_section_after(blocks, section_2_1_idx)
+        paragraph_texts = [
+            (i, "".join(inline.content for inline in block.inlines if hasattr(inline, 'content')))
+            for i, block in enumerate(blocks)
+            if isinstance(block, Paragraph) and block.inlines
+        ]
         
         for content_text in section_2_1_content:
-            for i, block in enumerate(blocks):
-                if isinstance(block, Paragraph) and block.inlines:
-                    text = ""
-                    for inline in block.inlines:
-                        if hasattr(inline, 'content'):
-                            text += inline.content
-                    
-                    if content_text in text:
-                        # Check if this block is NOT already in the right place
-                        # (i.e., it's not between section 2.1 and the next section)
-                        next_section_idx = _find_next_section_after(blocks, section_2_1_idx)
-                        
-                        if not (section_2_1_idx < i < next_section_idx):
-                            moves.append({
-                                'block_idx': i,
-                                'target_section_idx': section_2_1_idx,
-                                'content_preview': content_text[:50] + "...",
-                                'move_type': 'to_section_end'
-                            })
-                        break
+            for i, text in paragraph_texts:
+                if content_text in text:
+                    # Check if this block is NOT already in the right place
+                    # (i.e., it's not between section 2.1 and the next section)
+                    if not (section_2_1_idx < i < next_section_idx):
+                        moves.append({
+                            'block_idx': i,
+                            'target_section_idx': section_2_1_idx,
+                            'content_preview': content_text[:50] + "...",
+                            'move_type': 'to_section_end'
+                        })
+                    break
     
     return moves
 
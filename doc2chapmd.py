@@ -6,14 +6,13 @@ CLI tool to convert DOCX documents into structured Markdown chapters using docli
 """
 
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 import typer
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
 from core.model.config import load_config, PipelineConfig
-from core.pipeline import DocumentPipeline
 
 
 app = typer.Typer(
@@ -52,6 +51,11 @@ def convert(
         "--locale", "-l",
         help="Language/locale for processing"
     ),
+    cache_dir: Optional[Path] = typer.Option(
+        None,
+        "--cache-dir",
+        help="Directory for cached parse results (reused on reruns of the same file)"
+    ),
     verbose: bool = typer.Option(
         False,
         "--verbose", "-v",
@@ -86,6 +90,8 @@ def convert(
             config_overrides['assets_dir'] = assets_dir
         if locale is not None:
             config_overrides['locale'] = locale
+        if cache_dir is not None:
+            config_overrides['cache_dir'] = str(cache_dir)
         
         if config_overrides:
             config_dict = config.model_dump()
@@ -100,6 +106,9 @@ def convert(
             console.print(f"[blue]Locale:[/blue] {config.locale}")
             console.print()
         
+        # Late import so config-only commands don't pay for loading the pipeline stages
+        from core.pipeline import DocumentPipeline
+
         # Create pipeline
         pipeline = DocumentPipeline(config)
         
@@ -146,6 +155,67 @@ def convert(
         raise typer.Exit(1)
 
 
+@app.command()
+def batch(
+    input_files: List[Path] = typer.Argument(..., help="Paths to input DOCX files"),
+    output_dir: Path = typer.Option(
+        Path("out"),
+        "--output", "-o",
+        help="Output directory for generated files"
+    ),
+    config_file: Optional[Path] = typer.Option(
+        None,
+        "--config", "-c",
+        help="Path to configuration YAML file"
+    ),
+    parallel: Optional[int] = typer.Option(
+        None,
+        "--parallel", "-p",
+        help="Number of documents to process in parallel (defaults to the CPU count)",
+        min=1
+    )
+):
+    """
+    Convert several document files, processing them in parallel worker processes.
+    """
+    missing = [str(f) for f in input_files if not f.exists()]
+    if missing:
+        console.print(f"[red]Error: Input files do not exist: {', '.join(missing)}[/red]")
+        raise typer.Exit(1)
+
+    unsupported = [str(f) for f in input_files if f.suffix.lower() != '.docx']
+    if unsupported:
+        console.print(f"[red]Error: Unsupported file format: {', '.join(unsupported)}. Supported: .docx[/red]")
+        raise typer.Exit(1)
+
+    from core.pipeline import DocumentPipeline
+
+    pipeline = DocumentPipeline(load_config(config_file))
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        console=console,
+        transient=True
+    ) as progress:
+        progress.add_task(f"Processing {len(input_files)} documents...", total=None)
+        try:
+            results = pipeline.process_many([str(f) for f in input_files], str(output_dir), parallel)
+        except ValueError as e:
+            console.print(f"[red]Error: {e}[/red]")
+            raise typer.Exit(1)
+
+    failed = 0
+    for input_file, result in zip(input_files, results):
+        if result.success:
+            console.print(f"[green]✓[/green] {input_file}: {len(result.chapter_files)} chapters")
+        else:
+            failed += 1
+            console.print(f"[red]✗ {input_file}: {result.error_message}[/red]")
+
+    if failed:
+        raise typer.Exit(1)
+
+
 @app.command()
 def config_show(
     config_file: Optional[Path] = typer.Option(
@@ -0,0 +1,33 @@
+"""Shared pytest fixtures."""
+
+import zipfile
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def parse_cache_dir(tmp_path_factory):
+    """Parse cache shared across the session, so each sample DOCX is parsed only once."""
+    return str(tmp_path_factory.mktemp("parse-cache"))
+
+
+@pytest.fixture
+def write_minimal_docx():
+    """Factory writing a DOCX with one H1 heading and one body paragraph per given heading."""
+    def _write(path: Path, *headings: str) -> Path:
+        paragraphs = "".join(
+            f'<w:p><w:pPr><w:outlineLvl w:val="0"/></w:pPr><w:r><w:t>{heading}</w:t></w:r></w:p>'
+            f'<w:p><w:r><w:t>Body of {heading}.</w:t></w:r></w:p>'
+            for heading in headings
+        )
+        document_xml = (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+            '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+            f'<w:body>{paragraphs}</w:body></w:document>'
+        )
+        with zipfile.ZipFile(path, "w") as z:
+            z.writestr("word/document.xml", document_xml)
+        return path
+
+    return _write
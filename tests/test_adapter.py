@@ -1,7 +1,15 @@
 import hashlib
 from pathlib import Path
+from xml.etree import ElementTree as ET
+
+import pytest
+
+from core.adapters import document_parser
 from core.adapters.document_parser import parse_document
-from core.model.internal_doc import Paragraph, Image
+from core.adapters.docx_parser import NS, heading_level, compile_heading_patterns
+from core.adapters import parse_cache
+from core.adapters.parse_cache import file_sha256, parse_document_cached
+from core.model.internal_doc import Heading, Paragraph, Image
 
 def test_parse_with_real_docx():
     """
@@ -38,4 +46,109 @@ def test_parse_with_real_docx():
     print(f"Headings found: {len(headings)}")
     print(f"Paragraphs found: {len(paragraphs)}")
     
-    assert len(headings) > 0, "Should have at least one heading"
\ No newline at end of file
+    assert len(headings) > 0, "Should have at least one heading"
+
+
+def test_parse_document_cached_reuses_result(tmp_path: Path, monkeypatch, write_minimal_docx):
+    """
+    Tests that a second parse of the same file is served from the cache.
+    """
+    docx_path = tmp_path / "sample.docx"
+    write_minimal_docx(docx_path, "Intro")
+    cache_dir = tmp_path / "cache"
+
+    doc, resources = parse_document_cached(str(docx_path), str(cache_dir))
+    assert len(list(cache_dir.glob("*.pkl"))) == 1
+
+    def _fail(_path):
+        raise AssertionError("parse_document should not be called on a cache hit")
+
+    monkeypatch.setattr(document_parser, "parse_document", _fail)
+    cached_doc, cached_resources = parse_document_cached(str(docx_path), str(cache_dir))
+
+    assert cached_doc == doc
+    assert cached_resources == resources
+
+
+def test_parse_document_cached_reparses_unloadable_entry(tmp_path: Path, write_minimal_docx):
+    """
+    Tests that an entry which fails to unpickle is treated as a cache miss.
+    """
+    docx_path = tmp_path / "sample.docx"
+    write_minimal_docx(docx_path, "Intro")
+    cache_dir = tmp_path / "cache"
+
+    doc, _ = parse_document_cached(str(docx_path), str(cache_dir))
+    entry = next(cache_dir.glob("*.pkl"))
+    # A pickle that references a module which no longer exists
+    entry.write_bytes(b"cno_such_module\nGone\n.")
+
+    reparsed, _ = parse_document_cached(str(docx_path), str(cache_dir))
+
+    assert reparsed == doc
+
+
+def test_parse_document_cached_keys_on_parser_sources(tmp_path: Path, monkeypatch, write_minimal_docx):
+    """
+    Tests that a change in the parser fingerprint bypasses existing entries.
+    """
+    docx_path = tmp_path / "sample.docx"
+    write_minimal_docx(docx_path, "Intro")
+    cache_dir = tmp_path / "cache"
+
+    parse_document_cached(str(docx_path), str(cache_dir))
+    monkeypatch.setattr(parse_cache, "cache_version", lambda: "changed")
+    parse_document_cached(str(docx_path), str(cache_dir))
+
+    assert len(list(cache_dir.glob("*.pkl"))) == 2
+
+
+def test_file_sha256_matches_hashlib(tmp_path: Path, write_minimal_docx):
+    """
+    Tests that the chunked file hash equals a one-shot sha256 of the file bytes.
+    """
+    docx_path = tmp_path / "sample.docx"
+    write_minimal_docx(docx_path, "Intro")
+
+    assert file_sha256(str(docx_path)) == hashlib.sha256(docx_path.read_bytes()).hexdigest()
+
+
+def test_parse_document_cached_disabled_without_cache_dir(tmp_path: Path, write_minimal_docx):
+    """
+    Tests that no cache entry is written when caching is disabled.
+    """
+    docx_path = tmp_path / "sample.docx"
+    write_minimal_docx(docx_path, "Intro")
+
+    doc, _ = parse_document_cached(str(docx_path), None)
+
+    assert isinstance(doc.blocks[0], Heading)
+    assert not (tmp_path / "cache").exists()
+
+
+@pytest.mark.parametrize("style_name,expected", [
+    ("Heading 2", 2),
+    ("ROSA_Заголовок 4", 4),
+    ("Überschrift 6", 6),
+    ("my heading 8", 8),
+    ("Normal", None),
+])
+def test_heading_level_from_default_style_patterns(style_name, expected):
+    """Each default heading pattern still resolves through the fused regex."""
+    p = ET.fromstring(
+        f'<w:p xmlns:w="{NS["w"]}"><w:pPr><w:pStyle w:val="s1"/></w:pPr></w:p>'
+    )
+    assert heading_level(p, {"s1": style_name}) == expected
+
+
+@pytest.mark.parametrize("style_name,expected", [
+    ("Lvl3", 3),
+    ("Chapter 3", None),  # group 1 is not a digit, so the pattern is skipped
+])
+def test_heading_level_reads_group_one_of_custom_patterns(style_name, expected):
+    """Custom heading patterns keep taking the level from their first group."""
+    patterns = compile_heading_patterns([r"^(Chapter)\s*(\d)$", r"^Lvl(\d)$"])
+    p = ET.fromstring(
+        f'<w:p xmlns:w="{NS["w"]}"><w:pPr><w:pStyle w:val="s1"/></w:pPr></w:p>'
+    )
+    assert heading_level(p, {"s1": style_name}, patterns) == expected
@@ -0,0 +1,115 @@
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from core.adapters.chapter_extractor import (
+    _iter_body_paragraphs,
+    extract_and_export_chapter_map,
+    extract_chapter_structure,
+)
+from core.adapters.docx_parser import paragraph_text
+
+W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+
+
+def _document_xml(body: str) -> bytes:
+    return (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        f'<w:document xmlns:w="{W_NS}">{body}</w:document>'
+    ).encode("utf-8")
+
+
+def _para(text: str, outline_level: int = None, style: str = None) -> str:
+    ppr = ""
+    if outline_level is not None:
+        ppr = f'<w:pPr><w:outlineLvl w:val="{outline_level}"/></w:pPr>'
+    elif style is not None:
+        ppr = f'<w:pPr><w:pStyle w:val="{style}"/></w:pPr>'
+    return f"<w:p>{ppr}<w:r><w:t>{text}</w:t></w:r></w:p>"
+
+
+@pytest.fixture
+def multi_level_docx(tmp_path: Path) -> Path:
+    """DOCX with three heading levels, a style-based heading and a heading-styled table cell."""
+    body = "".join([
+        _para("1 Introduction", outline_level=0),
+        _para("Intro body."),
+        _para("1.1 Scope", outline_level=1),
+        _para("1.1.1 Details", style="H3"),
+        '<w:tbl><w:tr><w:tc>'
+        + _para("9 Table heading", outline_level=0)
+        + '</w:tc></w:tr></w:tbl>',
+        _para("1.2 Terms", outline_level=1),
+        _para("2 Setup", outline_level=0),
+        _para("Appendix", outline_level=0),
+        '<w:sectPr/>',
+    ])
+    styles_xml = (
+        f'<w:styles xmlns:w="{W_NS}">'
+        '<w:style w:type="paragraph" w:styleId="H3"><w:name w:val="heading 3"/></w:style>'
+        '</w:styles>'
+    )
+    path = tmp_path / "outline.docx"
+    with zipfile.ZipFile(path, "w") as z:
+        z.writestr("word/document.xml", _document_xml(f"<w:body>{body}</w:body>"))
+        z.writestr("word/styles.xml", styles_xml)
+    return path
+
+
+def test_iter_body_paragraphs_yields_direct_children_in_order():
+    """Only direct w:body paragraphs are yielded, in document order."""
+    doc_xml = _document_xml(
+        "<w:body>"
+        + _para("first")
+        + "<w:tbl><w:tr><w:tc>" + _para("in table") + "</w:tc></w:tr></w:tbl>"
+        + _para("second")
+        + _para("third")
+        + "</w:body>"
+    )
+
+    texts = [paragraph_text(p) for p in _iter_body_paragraphs(doc_xml)]
+
+    assert texts == ["first", "second", "third"]
+
+
+def test_iter_body_paragraphs_requires_body():
+    """A document without w:body is rejected."""
+    doc_xml = _document_xml(_para("orphan"))
+
+    with pytest.raises(RuntimeError, match="No <w:body> found"):
+        list(_iter_body_paragraphs(doc_xml))
+
+
+def test_extract_chapter_structure_builds_hierarchy(multi_level_docx: Path):
+    """Headings nest by level; table content and body paragraphs are skipped."""
+    chapters = extract_chapter_structure(multi_level_docx)
+
+    assert [(c.number, c.title) for c in chapters] == [
+        ("1", "Introduction"),
+        ("2", "Setup"),
+        ("", "Appendix"),
+    ]
+    intro = chapters[0]
+    assert [(c.level, c.number, c.title) for c in intro.children] == [
+        (2, "1.1", "Scope"),
+        (2, "1.2", "Terms"),
+    ]
+    assert [(c.level, c.full_text) for c in intro.children[0].children] == [
+        (3, "1.1.1 Details"),
+    ]
+
+
+def test_extract_and_export_chapter_map(multi_level_docx: Path):
+    """The exported map reports top-level count and maximum depth."""
+    structure = extract_and_export_chapter_map(multi_level_docx)["document_structure"]
+
+    assert structure["total_chapters"] == 3
+    assert structure["max_depth"] == 3
+    assert structure["chapters"][0]["children"][0]["children"][0] == {
+        "level": 3,
+        "title": "Details",
+        "number": "1.1.1",
+        "full_text": "1.1.1 Details",
+        "children": [],
+    }
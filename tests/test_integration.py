@@ -4,6 +4,8 @@ import json
 import tempfile
 from pathlib import Path
 
+import pytest
+
 from core.model.config import PipelineConfig
 from core.pipeline import DocumentPipeline
 
@@ -11,13 +13,13 @@ from core.pipeline import DocumentPipeline
 class TestDocumentPipelineIntegration:
     """End-to-end tests for the document processing pipeline."""
 
-    def test_pipeline_processes_docx_file(self):
+    def test_pipeline_processes_docx_file(self, parse_cache_dir):
         """Test that the pipeline can process a real DOCX file end-to-end."""
         # Arrange
         input_file = Path("/home/spec/work/rosa/docling/docx-s/cu-admin-install.docx")
         assert input_file.exists(), "Test DOCX file should exist"
         
-        config = PipelineConfig()
+        config = PipelineConfig(cache_dir=parse_cache_dir)
         pipeline = DocumentPipeline(config)
         
         # Act
@@ -44,11 +46,11 @@ class TestDocumentPipelineIntegration:
             for asset_file in result.asset_files:
                 assert Path(asset_file).exists(), f"Asset file should exist: {asset_file}"
 
-    def test_pipeline_generates_valid_index_md(self):
+    def test_pipeline_generates_valid_index_md(self, parse_cache_dir):
         """Test that the generated index.md has valid content."""
         # Arrange
         input_file = Path("/home/spec/work/rosa/docling/docx-s/cu-admin-install.docx")
-        config = PipelineConfig()
+        config = PipelineConfig(cache_dir=parse_cache_dir)
         pipeline = DocumentPipeline(config)
         
         # Act
@@ -64,11 +66,11 @@ class TestDocumentPipelineIntegration:
             assert index_content.startswith('#'), "Index should start with a heading"
             assert 'chapters/' in index_content, "Index should link to chapter files"
 
-    def test_pipeline_generates_valid_manifest_json(self):
+    def test_pipeline_generates_valid_manifest_json(self, parse_cache_dir):
         """Test that the generated manifest.json is valid JSON with expected structure."""
         # Arrange
         input_file = Path("/home/spec/work/rosa/docling/docx-s/cu-admin-install.docx")
-        config = PipelineConfig()
+        config = PipelineConfig(cache_dir=parse_cache_dir)
         pipeline = DocumentPipeline(config)
         
         # Act
@@ -93,7 +95,7 @@ class TestDocumentPipelineIntegration:
             assert 'title' in metadata, "Metadata should contain title"
             assert 'language' in metadata, "Metadata should contain language"
 
-    def test_pipeline_with_custom_config(self):
+    def test_pipeline_with_custom_config(self, parse_cache_dir):
         """Test that the pipeline respects custom configuration."""
         # Arrange
         input_file = Path("/home/spec/work/rosa/docling/docx-s/cu-admin-install.docx")
@@ -101,7 +103,8 @@ class TestDocumentPipelineIntegration:
             split_level=1,
             assets_dir="custom_assets",
             chapter_pattern="{index:03d}-custom-{slug}.md",
-            locale="fr"
+            locale="fr",
+            cache_dir=parse_cache_dir
         )
         pipeline = DocumentPipeline(config)
         
@@ -140,11 +143,11 @@ class TestDocumentPipelineIntegration:
             assert len(result.chapter_files) == 0, "Should not generate chapter files"
             assert len(result.asset_files) == 0, "Should not generate asset files"
 
-    def test_pipeline_creates_directory_structure(self):
+    def test_pipeline_creates_directory_structure(self, parse_cache_dir):
         """Test that the pipeline creates the expected directory structure."""
         # Arrange
         input_file = Path("/home/spec/work/rosa/docling/docx-s/cu-admin-install.docx")
-        config = PipelineConfig()
+        config = PipelineConfig(cache_dir=parse_cache_dir)
         pipeline = DocumentPipeline(config)
         
         # Act
@@ -164,4 +167,76 @@ class TestDocumentPipelineIntegration:
             assert assets_dir.exists(), "Assets directory should be created"
             
             assert (doc_dir / "index.md").exists(), "Index file should be created"
-            assert (doc_dir / "manifest.json").exists(), "Manifest file should be created"
\ No newline at end of file
+            assert (doc_dir / "manifest.json").exists(), "Manifest file should be created"
+
+    def test_process_many_returns_results_in_input_order(self, tmp_path, write_minimal_docx):
+        """Test that batch processing handles every input and preserves ordering."""
+        # Arrange
+        input_files = []
+        for name in ("first", "second"):
+            path = tmp_path / f"{name}.docx"
+            write_minimal_docx(path, f"{name.title()} chapter")
+            input_files.append(str(path))
+        input_files.append(str(tmp_path / "missing.docx"))
+
+        pipeline = DocumentPipeline(PipelineConfig())
+
+        # Act
+        results = pipeline.process_many(input_files, str(tmp_path / "out"), max_workers=2)
+
+        # Assert
+        assert [r.success for r in results] == [True, True, False]
+        assert "first" in results[0].index_file
+        assert "second" in results[1].index_file
+        assert results[2].error_message, "Should report the missing file"
+
+    @pytest.mark.parametrize("backend", ["thread", "process"])
+    def test_parallel_backends_match_serial_output(self, tmp_path, backend, write_minimal_docx):
+        """Test that parallel chapter rendering writes the same files as the serial path."""
+        # Arrange
+        input_file = tmp_path / "book.docx"
+        write_minimal_docx(input_file, "Intro", "Setup", "Usage", "Appendix")
+
+        # Act
+        serial = DocumentPipeline(PipelineConfig()).process(str(input_file), str(tmp_path / "serial"))
+        parallel = DocumentPipeline(PipelineConfig(parallel_backend=backend)).process(
+            str(input_file), str(tmp_path / backend)
+        )
+
+        # Assert
+        assert serial.success and parallel.success
+        assert [Path(f).name for f in parallel.chapter_files] == [Path(f).name for f in serial.chapter_files]
+        for serial_file, parallel_file in zip(serial.chapter_files, parallel.chapter_files):
+            assert Path(parallel_file).read_text(encoding="utf-8") == Path(serial_file).read_text(encoding="utf-8")
+        assert Path(parallel.manifest_file).read_bytes() == Path(serial.manifest_file).read_bytes()
+
+    def test_process_many_rejects_duplicate_stems(self, tmp_path, write_minimal_docx):
+        """Test that inputs which would share an output directory are rejected up front."""
+        # Arrange
+        (tmp_path / "a").mkdir()
+        (tmp_path / "b").mkdir()
+        first = write_minimal_docx(tmp_path / "a" / "x.docx", "First")
+        second = write_minimal_docx(tmp_path / "b" / "x.docx", "Second")
+        output_dir = tmp_path / "out"
+
+        # Act / Assert
+        with pytest.raises(ValueError, match="duplicate stems: x"):
+            DocumentPipeline(PipelineConfig()).process_many([str(first), str(second)], str(output_dir))
+        assert not output_dir.exists(), "Nothing should be written when inputs are rejected"
+
+
+def test_dump_manifest_matches_stdlib_json(monkeypatch):
+    """Test that manifest bytes are identical with and without orjson installed."""
+    from core import pipeline as pipeline_module
+
+    manifest_data = {
+        "metadata": {"title": "Руководство", "authors": [], "language": None},
+        "chapters": [{"title": "1 Введение", "path": "chapters/01-vvedenie.md"}],
+        "assets": {},
+    }
+    expected = json.dumps(manifest_data, indent=2, ensure_ascii=False).encode("utf-8")
+
+    assert pipeline_module._dump_manifest(manifest_data) == expected
+
+    monkeypatch.setattr(pipeline_module, "orjson", None)
+    assert pipeline_module._dump_manifest(manifest_data) == expected
@@ -6,10 +6,12 @@ from unittest.mock import patch, mock_open
 import tempfile
 import zipfile
 from pathlib import Path
+from xml.etree import ElementTree as ET
 
 from core.numbering.heading_numbering import (
     NumberedHeading, 
     extract_headings_with_numbers,
+    extract_headings_from_parts,
     _fmt,
     _roman,
     _slug
@@ -83,6 +85,26 @@ class TestHeadingNumbering:
             assert headings[0].number == "1"
 
 
+    def test_extract_headings_from_parsed_tree(self):
+        """Test heading extraction from an already-parsed document.xml tree."""
+        document_xml = b'''<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">
+        <w:body>
+            <w:p><w:pPr><w:outlineLvl w:val="0"/></w:pPr><w:r><w:t>First</w:t></w:r></w:p>
+            <w:p><w:pPr><w:outlineLvl w:val="1"/></w:pPr><w:r><w:t>Nested</w:t></w:r></w:p>
+            <w:p><w:r><w:t>Body text</w:t></w:r></w:p>
+        </w:body>
+        </w:document>'''
+
+        headings = extract_headings_from_parts(
+            ET.fromstring(document_xml), b"<numbering/>", b"<styles/>"
+        )
+
+        assert [(h.level, h.number, h.text) for h in headings] == [
+            (1, "1", "First"),
+            (2, "1.1", "Nested"),
+        ]
+
+
 class TestMdNumbering:
     """Tests for markdown numbering application."""
     
@@ -195,6 +217,25 @@ class TestValidators:
         with pytest.raises(NumberingValidationError, match="missing numbering"):
             validate_markdown_numbering(md_text)
 
+    def test_validate_markdown_numbering_crlf(self):
+        """Test that CRLF line endings are not read as part of heading titles."""
+        validate_markdown_numbering("# 1 Introduction\r\n## 1.1 Overview\r\n#\t\r\n")
+        validate_markdown_numbering("# \r\n1 x")
+        
+        with pytest.raises(NumberingValidationError, match="Line 2"):
+            validate_markdown_numbering("# 1 Introduction\r\n## Overview\r\n")
+    
+    def test_validate_markdown_numbering_other_line_breaks(self):
+        """Test that headings after non-LF line breaks are still checked."""
+        for sep in ("\r", "\x0c", "\u2028"):
+            with pytest.raises(NumberingValidationError, match="Line 2"):
+                validate_markdown_numbering(f"x{sep}# Foo\n")
+    
+    def test_validate_markdown_numbering_empty_heading(self):
+        """Test that a bare '#' line is not treated as a heading."""
+        validate_markdown_numbering("#\n# 1 Introduction\n")
+        validate_markdown_numbering("no headings here")
+
 
 class TestFileNaming:
     """Tests for file naming with extracted chapter numbers."""
@@ -1,7 +1,8 @@
 import hashlib
+import pytest
 from pathlib import Path
 
-from core.model.internal_doc import InternalDoc, Heading, Paragraph, Text, Bold, Image
+from core.model.internal_doc import InternalDoc, Heading, Paragraph, Text, Bold, Image, ListBlock, ListItem
 from core.model.resource_ref import ResourceRef
 from core.render.assets_exporter import export_assets
 from core.render.markdown_renderer import render_markdown
@@ -70,3 +71,14 @@ def test_render_markdown():
         "![An example image](assets/img_1.png)"
     )
     assert markdown_output == expected_markdown
+
+def test_render_markdown_rejects_unknown_block_type():
+    """
+    Tests that the renderer fails fast on block types it cannot render.
+    """
+    doc = InternalDoc(blocks=[
+        ListBlock(items=[ListItem(blocks=[Paragraph(inlines=[Text(content="item")])])]),
+    ])
+
+    with pytest.raises(ValueError, match="Unknown block type: list"):
+        render_markdown(doc, {})
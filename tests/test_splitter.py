@@ -62,3 +62,25 @@ def test_splitter_with_empty_document():
     chapters = split_into_chapters(doc, rules)
 
     assert len(chapters) == 0
+
+def test_splitter_groups_zero_chapter_sections_first():
+    """
+    Tests that front-matter sections are collected into chapter 0 ahead of the main chapters.
+    """
+    doc = InternalDoc(blocks=[
+        Paragraph(inlines=[Text(content="Title page")]),
+        Heading(level=1, text="Аннотация"),
+        Paragraph(inlines=[Text(content="Summary.")]),
+        Heading(level=1, text="1 Chapter 1"),
+        Paragraph(inlines=[Text(content="Content of chapter 1.")]),
+        Heading(level=1, text="2 Chapter 2"),
+    ])
+    rules = ChapterRules(level=1)
+
+    chapters = split_into_chapters(doc, rules)
+
+    assert len(chapters) == 3
+    assert [len(c.blocks) for c in chapters] == [3, 2, 1]
+    assert chapters[0].blocks[1].text == "Аннотация"
+    assert chapters[1].blocks[0].text == "1 Chapter 1"
+    assert chapters[2].blocks[0].text == "2 Chapter 2"